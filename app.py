@@ -1,8 +1,17 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import calendar
+import hashlib
+import io
 import re
+from datetime import datetime
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 st.set_page_config(page_title="NinjaTrader Backtest Analyzer", layout="wide")
 
@@ -100,49 +109,201 @@ st.markdown("""
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-def parse_profit(val):
-    """Parse NinjaTrader profit strings like '$558.00' or '($119.00)'."""
-    if pd.isna(val):
-        return 0.0
-    s = str(val).strip()
-    negative = "(" in s
-    s = re.sub(r"[$(,)]", "", s)
-    try:
-        v = float(s)
-    except ValueError:
-        return 0.0
-    return -v if negative else v
-
-
-def load_csv(uploaded_file):
-    """Read a NinjaTrader backtest CSV and return a cleaned DataFrame."""
-    df = pd.read_csv(uploaded_file)
-    # Drop fully-empty trailing column (NinjaTrader CSVs have a trailing comma)
-    df = df.loc[:, ~df.columns.str.match(r"^Unnamed")]
-    df.columns = df.columns.str.strip()
-
-    df["PnL"] = df["Profit"].apply(parse_profit)
-    df["ExitTime"] = pd.to_datetime(df["Exit time"], format="mixed", dayfirst=False)
-    df["EntryTime"] = pd.to_datetime(df["Entry time"], format="mixed", dayfirst=False)
-    return df
+_PROFIT_CLEAN_RE = re.compile(r"[$(,)]")
+
+
+def parse_profit(values):
+    """Parse a Series of NinjaTrader profit strings like '$558.00' or '($119.00)'."""
+    s = values.astype("string").str.strip()
+    negative = s.str.contains("(", regex=False).fillna(False).to_numpy(dtype=bool)
+    v = pd.to_numeric(s.str.replace(_PROFIT_CLEAN_RE, "", regex=True), errors="coerce")
+    v = v.fillna(0.0).to_numpy(dtype=float)
+    return np.where(negative, -v, v)
+
+
+# Timestamp layouts seen in NinjaTrader exports, most common first
+_DATETIME_FORMATS = [
+    "%m/%d/%Y %I:%M:%S %p",
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+]
 
 
-def compute_metrics(df, starting_capital=100_000):
-    """Return a dict of key performance metrics from a trades DataFrame."""
-    trades = df.sort_values("ExitTime").reset_index(drop=True)
-    cum = trades["PnL"].cumsum()
-    total_pnl = cum.iloc[-1] if len(cum) else 0.0
+def parse_datetimes(values):
+    """Parse a timestamp column using the single format detected from its first value."""
+    first = values.dropna()
+    if len(first):
+        sample = str(first.iloc[0]).strip()
+        for fmt in _DATETIME_FORMATS:
+            try:
+                datetime.strptime(sample, fmt)
+            except ValueError:
+                continue
+            try:
+                return pd.to_datetime(values, format=fmt, cache=True)
+            except ValueError:
+                break
+    return pd.to_datetime(values, format="mixed", dayfirst=False)
+
+
+# Columns read from a NinjaTrader export and the dtypes they are parsed as
+_CSV_DTYPES = {
+    "Strategy": "category",
+    "Profit": "string",
+    "Entry time": "string",
+    "Exit time": "string",
+}
+
+# Uploads larger than this are parsed with pyarrow's multi-threaded reader
+_PYARROW_MIN_BYTES = 50 * 1024 * 1024
+
+
+def load_csv_bytes(data):
+    """Read NinjaTrader backtest CSV bytes.
+
+    Returns ``(df, meta)``: the cleaned trades sorted by ExitTime, and a dict
+    with the ``strategy`` name from the first row (``None`` if absent).
+    """
+    # Peek at the header so only the needed columns are tokenized; this also
+    # skips the empty trailing column (NinjaTrader CSVs have a trailing comma)
+    header = pd.read_csv(io.BytesIO(data), nrows=0).columns
+    usecols = [c for c in header if c.strip() in _CSV_DTYPES]
+    dtype = {c: _CSV_DTYPES[c.strip()] for c in usecols}
+    df = None
+    if len(data) > _PYARROW_MIN_BYTES:
+        try:
+            df = pd.read_csv(
+                io.BytesIO(data),
+                usecols=usecols,
+                dtype=dtype,
+                engine="pyarrow",
+                dtype_backend="pyarrow",
+            )
+        except ImportError:
+            pass
+    if df is None:
+        df = pd.read_csv(io.BytesIO(data), usecols=usecols, dtype=dtype, engine="c")
+    df.columns = df.columns.str.strip()
 
-    # Drawdown series (dollar)
-    peak = cum.cummax()
+    df["PnL"] = parse_profit(df["Profit"])
+    df["ExitTime"] = parse_datetimes(df["Exit time"])
+    df["EntryTime"] = parse_datetimes(df["Entry time"])
+    meta = {"strategy": df["Strategy"].iat[0] if "Strategy" in df.columns and len(df) else None}
+    # Rows without an exit time (e.g. a comma-only trailer) are not trades;
+    # dropping them keeps the ExitTime searchsorted slices valid
+    df = df[df["ExitTime"].notna()].reset_index(drop=True)
+    # NinjaTrader usually writes trades in exit order already
+    if not df["ExitTime"].is_monotonic_increasing:
+        df = df.sort_values("ExitTime", kind="stable").reset_index(drop=True)
+    return df, meta
+
+
+def pnl_values(trades):
+    """Return the PnL column as a float64 numpy array."""
+    return trades["PnL"].to_numpy(dtype=np.float64)
+
+
+def monthly_pnl(trades):
+    """Sum PnL per exit month of a trades DataFrame already sorted by ExitTime.
+
+    Returns ``(codes, totals)`` for every month with at least one trade, where
+    each code is ``year * 12 + month - 1``.
+    """
+    exit_times = trades["ExitTime"]
+    codes = exit_times.dt.year.to_numpy() * 12 + exit_times.dt.month.to_numpy() - 1
+    month_codes, starts = np.unique(codes, return_index=True)
+    if not len(starts):
+        return month_codes, np.zeros(0)
+    return month_codes, np.add.reduceat(pnl_values(trades), starts)
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def parsed_csv(key, _data):
+    """Parse an upload once and keep ``(df, meta)`` across reruns and sessions.
+
+    ``key`` identifies the file contents (name, size and md5), so the bytes
+    themselves are never hashed by Streamlit. The returned frame is shared,
+    not copied: callers must treat it as read-only.
+    """
+    return load_csv_bytes(_data)
+
+
+def equity_stats(pnl, starting_capital):
+    """Return (cum, dd, dd_pct, wins, gross_profit, gross_loss) for a float64 PnL array."""
+    cum = np.cumsum(pnl)
+    # The equity peak is the P&L peak shifted by the starting capital
+    peak = np.maximum.accumulate(cum)
     dd = cum - peak
-    max_dd = dd.min() if len(dd) else 0.0
-
-    # Drawdown series (% of equity = capital + cumulative P&L)
-    equity = starting_capital + cum
-    equity_peak = equity.cummax()
-    dd_pct = (equity - equity_peak) / equity_peak * 100
-    max_dd_pct = dd_pct.min() if len(dd_pct) else 0.0
+    dd_pct = dd / (starting_capital + peak) * 100
+    is_win = pnl > 0
+    wins = int(np.count_nonzero(is_win))
+    gross_profit = np.where(is_win, pnl, 0.0).sum()
+    gross_loss = -np.where(pnl < 0, pnl, 0.0).sum()
+    return cum, dd, dd_pct, wins, gross_profit, gross_loss
+
+
+def equity_stats_loop(pnl, starting_capital):
+    """Single-pass equivalent of ``equity_stats``, written to be compiled by numba."""
+    n = pnl.shape[0]
+    cum = np.empty(n)
+    dd = np.empty(n)
+    dd_pct = np.empty(n)
+    total = 0.0
+    peak = -np.inf
+    wins = 0
+    gross_profit = 0.0
+    gross_loss = 0.0
+    for i in range(n):
+        v = pnl[i]
+        total += v
+        if total > peak:
+            peak = total
+        cum[i] = total
+        dd[i] = total - peak
+        dd_pct[i] = dd[i] / (starting_capital + peak) * 100.0
+        if v > 0:
+            wins += 1
+            gross_profit += v
+        elif v < 0:
+            gross_loss -= v
+    return cum, dd, dd_pct, wins, gross_profit, gross_loss
+
+
+@st.cache_resource(show_spinner=False)
+def equity_stats_kernel():
+    """Return the metrics kernel: ``equity_stats_loop`` compiled once per process, or
+    the numpy ``equity_stats`` when numba is not installed.
+
+    Streamlit re-executes this module on every rerun, so the compiled dispatcher
+    has to live in the resource cache rather than at module level.
+    """
+    if njit is None:
+        return equity_stats
+    kernel = njit(boundscheck=False, error_model="numpy")(equity_stats_loop)
+    kernel(np.zeros(1), 1.0)
+    return kernel
+
+
+def compute_metrics(df, starting_capital=100_000, monthly=None):
+    """Return a dict of key performance metrics from a trades DataFrame.
+
+    ``monthly`` is the ``monthly_pnl`` result for ``df`` when the caller has
+    already computed it.
+    """
+    trades = df
+    if not trades["ExitTime"].is_monotonic_increasing:
+        trades = trades.sort_values("ExitTime", kind="stable").reset_index(drop=True)
+    pnl = pnl_values(trades)
+    n_trades = len(pnl)
+    cum, dd, dd_pct, wins, gross_profit, gross_loss = equity_stats_kernel()(pnl, float(starting_capital))
+    total_pnl = cum[-1] if n_trades else 0.0
+
+    # Drawdown, in dollars and as % of equity (capital + cumulative P&L)
+    max_dd = dd.min() if n_trades else 0.0
+    max_dd_pct = dd_pct.min() if n_trades else 0.0
 
     # CAGR
     start = trades["ExitTime"].iloc[0]
@@ -151,22 +312,22 @@ def compute_metrics(df, starting_capital=100_000):
     cagr = ((starting_capital + total_pnl) / starting_capital) ** (1 / years) - 1
 
     # Win rate
-    n_trades = len(trades)
-    wins = (trades["PnL"] > 0).sum()
     win_rate = wins / n_trades if n_trades else 0
 
     # Profit factor
-    gross_profit = trades.loc[trades["PnL"] > 0, "PnL"].sum()
-    gross_loss = abs(trades.loc[trades["PnL"] < 0, "PnL"].sum())
     profit_factor = gross_profit / gross_loss if gross_loss else float("inf")
 
-    # Win months
-    monthly = trades.set_index("ExitTime")["PnL"].resample("ME").sum()
-    win_months_pct = (monthly > 0).sum() / len(monthly) if len(monthly) else 0
+    # Win months (months without trades count towards the total)
+    month_codes, month_totals = monthly if monthly is not None else monthly_pnl(trades)
+    total_months = int(month_codes[-1] - month_codes[0] + 1) if len(month_codes) else 0
+    months_profitable = int(np.count_nonzero(month_totals > 0))
+    win_months_pct = months_profitable / total_months if total_months else 0
 
     return {
         "total_pnl": total_pnl,
+        "total_return_pct": total_pnl / starting_capital * 100,
         "starting_capital": starting_capital,
+        "suggested_capital": starting_capital + abs(max_dd) * 2,
         "cagr": cagr,
         "max_dd": max_dd,
         "max_dd_pct": max_dd_pct,
@@ -175,8 +336,8 @@ def compute_metrics(df, starting_capital=100_000):
         "win_rate": win_rate,
         "profit_factor": profit_factor,
         "win_months_pct": win_months_pct,
-        "months_profitable": int((monthly > 0).sum()) if len(monthly) else 0,
-        "total_months": len(monthly),
+        "months_profitable": months_profitable,
+        "total_months": total_months,
         "cum_series": cum,
         "dd_series": dd,
         "dd_pct_series": dd_pct,
@@ -184,18 +345,26 @@ def compute_metrics(df, starting_capital=100_000):
     }
 
 
-def monthly_returns_table(df, starting_capital):
-    """Build a pivot DataFrame of monthly returns as % of starting capital."""
-    trades = df.sort_values("ExitTime").copy()
-    trades["Year"] = trades["ExitTime"].dt.year
-    trades["Month"] = trades["ExitTime"].dt.month
-    pivot = trades.groupby(["Year", "Month"])["PnL"].sum().unstack(fill_value=0)
-    # Ensure all 12 months present
-    for m in range(1, 13):
-        if m not in pivot.columns:
-            pivot[m] = 0.0
-    pivot = pivot[sorted(pivot.columns)]
-    pivot["YTD"] = pivot.sum(axis=1)
+@st.cache_data(show_spinner=False)
+def monthly_pivot(month_codes, month_totals):
+    """Build a Year x month pivot of dollar P&L (plus YTD) from monthly totals."""
+    years, year_idx = np.unique(month_codes // 12, return_inverse=True)
+    # Codes are unique, so each month lands in its own cell of a Year x 12 grid
+    grid = np.zeros((len(years), 12))
+    grid[year_idx, month_codes % 12] = month_totals
+    pivot = pd.DataFrame(grid, index=pd.Index(years, name="Year"), columns=range(1, 13))
+    pivot["YTD"] = grid.sum(axis=1)
+    return pivot
+
+
+def monthly_returns_table(monthly, starting_capital):
+    """Build a pivot DataFrame of monthly returns as % of starting capital.
+
+    ``monthly`` is the ``(codes, totals)`` pair returned by ``monthly_pnl``.
+    The dollar pivot is cached on those arrays alone, so changing the capital
+    only redoes the percentage conversion.
+    """
+    pivot = monthly_pivot(*monthly)
     # Convert to % of starting capital
     pivot_pct = pivot / starting_capital * 100
     return pivot, pivot_pct
@@ -205,21 +374,54 @@ def render_monthly_html(pivot_pct, pivot_dollar):
     """Convert monthly returns pivot to a styled HTML table with % and $ tooltip."""
     month_names = [calendar.month_abbr[m].upper() for m in range(1, 13)] + ["YTD"]
     header = "<tr><th>YEAR</th>" + "".join(f"<th>{m}</th>" for m in month_names) + "</tr>"
-    rows = []
-    for year in pivot_pct.index:
-        pct_row = pivot_pct.loc[year]
-        dlr_row = pivot_dollar.loc[year]
-        cells = f'<td class="year-cell">{year}</td>'
-        for pct_val, dlr_val in zip(pct_row, dlr_row):
-            if pct_val > 0:
-                cls = "pos"
-            elif pct_val < 0:
-                cls = "neg"
-            else:
-                cls = "zero"
-            cells += f'<td class="{cls}" title="${dlr_val:,.0f}">{pct_val:+.1f}%</td>'
-        rows.append(f"<tr>{cells}</tr>")
-    return f'<table class="monthly-table">{header}{"".join(rows)}</table>'
+    pct = pivot_pct.to_numpy()
+    classes = np.where(pct > 0, "pos", np.where(pct < 0, "neg", "zero"))
+    parts = ['<table class="monthly-table">', header]
+    for year, cls_row, pct_row, dlr_row in zip(pivot_pct.index, classes, pct, pivot_dollar.to_numpy()):
+        parts.append(f'<tr><td class="year-cell">{year}</td>')
+        parts.extend(
+            f'<td class="{cls}" title="${dlr_val:,.0f}">{pct_val:+.1f}%</td>'
+            for cls, pct_val, dlr_val in zip(cls_row, pct_row, dlr_row)
+        )
+        parts.append("</tr>")
+    parts.append("</table>")
+    return "".join(parts)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def individual_curve(file_key, _sdf, start_date, capital):
+    """Return one strategy's cumulative P&L curve from ``start_date``, or None if empty.
+
+    ``file_key`` is the ``parsed_csv`` key of ``_sdf``, which stands in for the
+    (unhashed) frame in the cache key.
+    """
+    exit_times = _sdf["ExitTime"].to_numpy()
+    i = exit_times.searchsorted(np.datetime64(start_date))
+    if i == len(exit_times):
+        return None
+    cum = np.cumsum(pnl_values(_sdf.iloc[i:]))
+    return {
+        "exit_times": exit_times[i:],
+        "cum_pct": cum / capital * 100,
+        "cum_dollar": cum,
+    }
+
+
+# Equity/drawdown curves are thinned to roughly this many points before being
+# sent to the browser; more points than chart pixels only adds payload
+_PLOT_MAX_POINTS = 4000
+
+
+def plot_index(n, keep=()):
+    """Positions to plot from an n-point curve, strided down to about _PLOT_MAX_POINTS.
+
+    The last point and any positions in ``keep`` (e.g. the drawdown trough)
+    are always included so the thinned curve ends and bottoms out correctly.
+    """
+    step = -(-n // _PLOT_MAX_POINTS)
+    if step <= 1:
+        return np.arange(n)
+    return np.union1d(np.arange(0, n, step), np.asarray([n - 1, *keep], dtype=np.intp))
 
 
 def metric_card(label, value, color="", tooltip=""):
@@ -257,12 +459,16 @@ if not uploaded_files:
 
 # Parse all uploads and collect capital inputs
 all_dfs = {}
+file_keys = {}
 capital_map = {}
 for f in uploaded_files:
-    df = load_csv(f)
-    strat_name = df["Strategy"].iloc[0] if "Strategy" in df.columns else f.name.replace(".csv", "")
+    data = f.getvalue()
+    key = (f.name, len(data), hashlib.md5(data).hexdigest())
+    df, meta = parsed_csv(key, data)
+    strat_name = meta["strategy"] or f.name.replace(".csv", "")
     label = f"{strat_name} ({f.name})"
     all_dfs[label] = df
+    file_keys[label] = key
     capital_map[label] = st.number_input(
         f"Initial Capital — {strat_name}",
         min_value=0,
@@ -284,8 +490,12 @@ if not selected:
     st.stop()
 
 # Combine selected
-combined = pd.concat([all_dfs[s] for s in selected], ignore_index=True)
-combined = combined.sort_values("ExitTime").reset_index(drop=True)
+if len(selected) == 1:
+    combined = all_dfs[selected[0]]
+else:
+    combined = pd.concat([all_dfs[s] for s in selected], ignore_index=True)
+    order = np.argsort(combined["ExitTime"].to_numpy(), kind="stable")
+    combined = combined.take(order).reset_index(drop=True)
 total_capital = sum(capital_map[s] for s in selected)
 
 # Start date filter
@@ -298,7 +508,9 @@ start_date = st.sidebar.date_input(
     min_value=min_date,
     max_value=max_date,
 )
-combined = combined[combined["ExitTime"] >= pd.Timestamp(start_date)].reset_index(drop=True)
+start_ts = np.datetime64(start_date)
+# Frames are sorted by ExitTime, so the date filter is a positional slice
+combined = combined.iloc[combined["ExitTime"].to_numpy().searchsorted(start_ts):].reset_index(drop=True)
 
 if combined.empty:
     st.warning("No trades after the selected start date.")
@@ -308,22 +520,16 @@ if combined.empty:
 st.sidebar.header("Chart Options")
 show_individual = st.sidebar.checkbox("Show individual equity curves", value=False)
 
-m = compute_metrics(combined, starting_capital=total_capital)
+monthly = monthly_pnl(combined)
+m = compute_metrics(combined, starting_capital=total_capital, monthly=monthly)
 
 # Pre-compute individual strategy curves (date-filtered) for overlay
 individual_curves = {}
 if show_individual and len(selected) > 1:
     for s in selected:
-        sdf = all_dfs[s].copy()
-        sdf = sdf[sdf["ExitTime"] >= pd.Timestamp(start_date)].sort_values("ExitTime").reset_index(drop=True)
-        if not sdf.empty:
-            cap = capital_map[s]
-            cum = sdf["PnL"].cumsum()
-            individual_curves[s] = {
-                "exit_times": sdf["ExitTime"],
-                "cum_pct": cum / cap * 100,
-                "cum_dollar": cum,
-            }
+        curve = individual_curve(file_keys[s], all_dfs[s], start_date, capital_map[s])
+        if curve is not None:
+            individual_curves[s] = curve
 
 # ---------------------------------------------------------------------------
 # Metric cards row
@@ -344,7 +550,7 @@ for col, (label, value, color, tip) in zip(cols, cards):
 # Monthly Returns Table
 # ---------------------------------------------------------------------------
 st.markdown("#### Monthly Returns")
-pivot_dollar, pivot_pct = monthly_returns_table(combined, total_capital)
+pivot_dollar, pivot_pct = monthly_returns_table(monthly, total_capital)
 st.markdown(render_monthly_html(pivot_pct, pivot_dollar), unsafe_allow_html=True)
 
 st.markdown('<br><div style="text-align:center;color:#8a8aa3;font-size:0.82rem;font-weight:600;letter-spacing:0.5px;">HYPOTHETICAL PERFORMANCE</div>', unsafe_allow_html=True)
@@ -356,7 +562,10 @@ chart_col, summary_col = st.columns([3, 1])
 
 with chart_col:
     # Equity curve (% return with $ in hover)
-    cum_pct = m["cum_series"] / total_capital * 100
+    idx = plot_index(m["n_trades"], keep=(int(np.argmin(m["dd_pct_series"])),))
+    exit_times = m["exit_times"].to_numpy()[idx]
+    cum_dollar = m["cum_series"][idx]
+    cum_pct = cum_dollar / total_capital * 100
     fig_eq = go.Figure()
 
     # Individual strategy curves (behind combined)
@@ -364,18 +573,19 @@ with chart_col:
     for i, (label, curve) in enumerate(individual_curves.items()):
         color = palette[i % len(palette)]
         short_name = label.split(" (")[0]
+        curve_idx = plot_index(len(curve["exit_times"]))
         fig_eq.add_trace(go.Scatter(
-            x=curve["exit_times"],
-            y=curve["cum_pct"],
+            x=curve["exit_times"][curve_idx],
+            y=curve["cum_pct"][curve_idx],
             line=dict(color=color, width=1.5, dash="dot"),
             name=short_name,
-            customdata=curve["cum_dollar"],
+            customdata=curve["cum_dollar"][curve_idx],
             hovertemplate=f"{short_name}<br>%{{y:.1f}}%<br>${{%{{customdata:,.0f}}}}<extra></extra>",
             opacity=0.7,
         ))
 
     fig_eq.add_trace(go.Scatter(
-        x=m["exit_times"],
+        x=exit_times,
         y=cum_pct,
         fill="tozeroy",
         fillgradient=dict(
@@ -384,7 +594,7 @@ with chart_col:
         ),
         line=dict(color="#00c853", width=2),
         name="Combined",
-        customdata=m["cum_series"],
+        customdata=cum_dollar,
         hovertemplate="Combined<br>%{y:.1f}%<br>$%{customdata:,.0f}<extra></extra>",
     ))
     fig_eq.update_layout(
@@ -406,8 +616,8 @@ with chart_col:
     # Drawdown chart (% with $ in hover)
     fig_dd = go.Figure()
     fig_dd.add_trace(go.Scatter(
-        x=m["exit_times"],
-        y=m["dd_pct_series"],
+        x=exit_times,
+        y=m["dd_pct_series"][idx],
         fill="tozeroy",
         fillgradient=dict(
             type="vertical",
@@ -415,7 +625,7 @@ with chart_col:
         ),
         line=dict(color="#ff5252", width=1.5),
         name="Drawdown",
-        customdata=m["dd_series"],
+        customdata=m["dd_series"][idx],
         hovertemplate="%{y:.1f}%<br>$%{customdata:,.0f}<extra></extra>",
     ))
     fig_dd.update_layout(
@@ -433,16 +643,14 @@ with chart_col:
     st.plotly_chart(fig_dd, use_container_width=True)
 
 with summary_col:
-    suggested_capital = total_capital + abs(m["max_dd"]) * 2
-    total_return_pct = m["total_pnl"] / total_capital * 100
     summary_items = [
         ("Number of Trades", f"{m['n_trades']:,}"),
-        ("Initial Capital", f"${total_capital:,.0f}"),
-        ("Suggested Min Capital", f"${suggested_capital:,.0f}"),
+        ("Initial Capital", f"${m['starting_capital']:,.0f}"),
+        ("Suggested Min Capital", f"${m['suggested_capital']:,.0f}"),
         ("Win Rate", f"{m['win_rate']:.1%}"),
         ("Profitable Trades", f"{m['wins']:,}"),
         ("Months Profitable", f"{m['months_profitable']} / {m['total_months']}"),
-        ("Total Net Profit", f"{total_return_pct:+.1f}% (${m['total_pnl']:,.0f})"),
+        ("Total Net Profit", f"{m['total_return_pct']:+.1f}% (${m['total_pnl']:,.0f})"),
         ("Max Drawdown", f"{m['max_dd_pct']:.1f}% (${m['max_dd']:,.0f})"),
         ("Profit Factor", f"{m['profit_factor']:.2f}" if m["profit_factor"] != float("inf") else "∞"),
     ]